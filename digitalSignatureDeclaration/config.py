@@ -1,16 +1,19 @@
+import functools
 import os
 import sys
 
+@functools.lru_cache(maxsize=None)
 def local_dir() -> str:
     """
     Returns the directory where this file (config.py) resides,
-    or _MEIPASS if in a PyInstaller environment.
+    or _MEIPASS if in a PyInstaller environment. Computed once per process.
     """
     if getattr(sys, 'frozen', False) and hasattr(sys, '_MEIPASS'):
         return sys._MEIPASS
     # fallback: directory of config.py
     return os.path.dirname(os.path.abspath(__file__))
 
+@functools.lru_cache(maxsize=None)
 def icon_path() -> str:
     """
     Returns the absolute path to the program icon.
@@ -18,13 +21,7 @@ def icon_path() -> str:
     """
     return os.path.join(local_dir(), "1000_F_387566890_YDxCELaaf9EJQYHpBojljnvCm8gX7NDW.ico")
 
-def poppler_bin() -> str:
-    """
-    Returns the path to the poppler bin folder for pdf2image usage.
-    If not set, defaults to a local 'poppler-23.05.0/Library/bin'.
-    """
-    return os.getenv("POPPLER_PATH", "poppler-23.05.0/Library/bin")
-
+@functools.lru_cache(maxsize=None)
 def signatures_dir() -> str:
     """
     Returns the path to the 'signatures' folder,
@@ -18,24 +18,49 @@ import os
 import os.path
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 from digitalSignatureDeclaration import sign_declaration, detect_declaration_type
 from digitalSignatureDeclaration.config import icon_path
 
 
+DATA_FILE = "app_data.json"
+
+# Last values loaded from or written to DATA_FILE
+_cached_data = None
+
+
 def load_data():
-    if os.path.exists("app_data.json"):
-        with open("app_data.json", "r") as file:
-            return json.load(file)
-    return {}
+    global _cached_data
+    if _cached_data is None:
+        _cached_data = {}
+        if os.path.exists(DATA_FILE):
+            with open(DATA_FILE, "rb") as file:
+                _cached_data = json.loads(file.read())
+    return dict(_cached_data)
 
 
 def save_data(name, id, gender, output_folder):
+    global _cached_data
     data = {"name": name, "id": id, "gender": gender, "output_folder": output_folder}
-    with open("app_data.json", "w") as file:
-        json.dump(data, file)
+    if data == _cached_data:
+        return
+    tmp_path = DATA_FILE + ".tmp"
+    with open(tmp_path, "w") as file:
+        json.dump(data, file, separators=(",", ":"))
+    os.replace(tmp_path, DATA_FILE)
+    _cached_data = data
 
 
+def open_file(path):
+    """ Open a file with the platform's default application, without spawning a shell """
+    if sys.platform == "win32":
+        os.startfile(path)
+    elif sys.platform == "darwin":
+        subprocess.Popen(["open", path])
+    else:
+        subprocess.Popen(["xdg-open", path])
+
 
 def resource_path(relative_path):
     """ Get absolute path to resource, works for dev and for PyInstaller """
@@ -55,8 +80,9 @@ def main():
         Steps:
         1. Loads user preferences from local JSON (app_data.json).
         2. Provides inputs for name, ID, gender, and file selection.
-        3. Calls sign_declaration(...) once the user selects 'Begin'.
-        4. Spawns a new process to open the signed PDF upon completion.
+        3. Calls sign_declaration(...) on a worker thread once the user selects 'Begin',
+           keeping the window responsive while the PDF is produced.
+        4. Opens the signed PDF with the default viewer upon completion.
         """
 
     import tkinter as tk
@@ -69,6 +95,9 @@ def main():
     file_path = None
     output_folder = data.get("output_folder", "")  # Loading saved data
 
+    # Signing runs on a single worker thread so the Tk event loop keeps running
+    executor = ThreadPoolExecutor(max_workers=1)
+
     # GUI code
     root = tk.Tk()
     root.title("Sign Declaration")
@@ -123,6 +152,13 @@ def main():
         nonlocal output_folder  # Declare output_folder as nonlocal to modify it
         output_folder = filedialog.askdirectory()
 
+    # Enables or disables every input; PyMuPDF must not be used from two threads at once
+    def set_inputs_enabled(enabled):
+        state = ["!disabled"] if enabled else ["disabled"]
+        for widget in (entry_name, entry_id, radio_company, radio_person, radio_male, radio_female,
+                       button_select_file, button_select_folder, button_begin):
+            widget.state(state)
+
     # The function that gets executed when the user presses the "Begin" button
     def on_begin_button():
         name = entry_name.get()
@@ -141,8 +177,35 @@ def main():
             messagebox.showerror("Error", str(e))
             return
 
-        output_pdf_path = sign_declaration(name, id, file_path, output_folder, declaration_type, declarator_gender)
-        subprocess.Popen([output_pdf_path], shell=True)
+        future = executor.submit(sign_declaration, name, id, file_path, output_folder, declaration_type,
+                                 declarator_gender)
+        set_inputs_enabled(False)
+        progress_bar.pack()
+        progress_bar.start()
+        root.after(100, poll_future, future)
+
+    # Checks whether signing has finished, rescheduling itself until it has
+    def poll_future(future):
+        if not future.done():
+            root.after(100, poll_future, future)
+            return
+
+        progress_bar.stop()
+        progress_bar.pack_forget()
+        set_inputs_enabled(True)
+
+        try:
+            output_pdf_path = future.result()
+        except Exception as e:
+            messagebox.showerror("Error", str(e))
+            return
+
+        try:
+            open_file(output_pdf_path)
+        except OSError as e:
+            messagebox.showerror("Error", f"Signed PDF saved to {output_pdf_path}, but it could not be opened: {e}")
+            return
+
         messagebox.showinfo("Info", "Process completed")
 
     # Buttons to select file and folder
@@ -156,8 +219,12 @@ def main():
     button_begin = ttk.Button(root, text="Begin", command=on_begin_button)
     button_begin.pack()
 
+    # Shown only while a declaration is being signed
+    progress_bar = ttk.Progressbar(root, mode='indeterminate')
+
     # Start the GUI
     root.mainloop()
+    executor.shutdown(wait=False)
 
 
 if __name__ == "__main__":
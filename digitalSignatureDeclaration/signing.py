@@ -1,37 +1,62 @@
 """
 signing.py
 
-Core module for generating PDF declarations in Hebrew, merging them with an existing
+Core module for generating PDF declarations in Hebrew, overlaying them on an existing
 PDF, adding image-based signatures, and adjusting final PDF size to A4.
 
 Exposes:
     - sign_declaration(...): The main entry point for creating a signed, final PDF.
 """
 
+import functools
 import io
 import os
+from collections import namedtuple
 from datetime import date
 
-import PyPDF2
-from PIL import Image
-from pdf2image import convert_from_path
-from pdfrw import PdfReader, PdfWriter, PageMerge
+import pymupdf
 from reportlab.lib.pagesizes import letter
 from reportlab.pdfbase import pdfmetrics
 from reportlab.pdfbase.ttfonts import TTFont
 from reportlab.pdfgen import canvas
 
-from digitalSignatureDeclaration.config import SIGNATURE_PATHS, poppler_bin
+from digitalSignatureDeclaration.config import SIGNATURE_PATHS
+
+# Signature offsets were originally tuned on a 200 DPI rendering of the page.
+PIXELS_TO_POINTS = 72 / 200
+A4_WIDTH = 595.28
+
+OFFICE_LINE = 'עו"ד מירי רז במשרדי שברחוב השרון 1 קריית שדה התעופה'
+SEPARATOR_LINE = '**************************************'
+LAWYER_STAMP_LINE = 'מירי רז יוקל מ.ר 23145'
+
+# Static lines never contain the date, so their reversed form is fixed.
+_STATIC_LINES_REVERSED = {line: line[::-1] for line in (OFFICE_LINE, SEPARATOR_LINE, LAWYER_STAMP_LINE)}
+
+GenderTerms = namedtuple('GenderTerms', ['title', 'known', 'warned', 'pronoun', 'expected', 'confirmed', 'signed'])
+
+_MALE_TERMS = GenderTerms('מר', 'המוכר', 'שהוזהר', 'עליו', 'צפוי', 'אישר', 'חתם')
+_FEMALE_TERMS = GenderTerms('גב', 'המוכרת', 'שהוזהרה', 'עליה', 'צפויה', 'אישרה', 'חתמה')
 
 
 def register_hebrew_font():
     """
     Registers the 'Arial.ttf' font with ReportLab for Hebrew character support.
+    Does nothing if the font is already registered.
 
     Raises:
         TTFError: If the font file is not found or fails to load.
     """
-    pdfmetrics.registerFont(TTFont('Arial', 'Arial.ttf'))
+    if 'Arial' not in pdfmetrics.getRegisteredFontNames():
+        pdfmetrics.registerFont(TTFont('Arial', 'Arial.ttf'))
+
+
+@functools.lru_cache(maxsize=64)
+def _width(line):
+    """
+    Returns the rendered width of a line in the declaration font (Arial, 12pt).
+    """
+    return pdfmetrics.stringWidth(line, 'Arial', 12)
 
 
 def generate_declaration_text(current_date, declarator_name, id_number, declarator_gender):
@@ -48,47 +73,38 @@ def generate_declaration_text(current_date, declarator_name, id_number, declarat
         List[str]: The lines of text to be placed on the PDF declaration.
     """
 
-    gender_terms = {
-        'male': {
-            'title': 'מר', 'known': 'המוכר', 'warned': 'שהוזהר',
-            'pronoun': 'עליו', 'expected': 'צפוי', 'confirmed': 'אישר', 'signed': 'חתם'
-        },
-        'female': {
-            'title': 'גב', 'known': 'המוכרת', 'warned': 'שהוזהרה',
-            'pronoun': 'עליה', 'expected': 'צפויה', 'confirmed': 'אישרה', 'signed': 'חתמה'
-        }
-    }
-    terms = gender_terms.get(declarator_gender.lower(), gender_terms['male'])
+    terms = _FEMALE_TERMS if declarator_gender.lower() == 'female' else _MALE_TERMS
+    title, known, warned, pronoun, expected, confirmed, signed = terms
 
     declaration_text_lines = [
         f' הריני מאשרת כי ביום {current_date} הופיע בפני ',
-        'עו"ד מירי רז במשרדי שברחוב השרון 1 קריית שדה התעופה',
-        f'{terms["title"]} {declarator_name} ת.ז {id_number} {terms["known"]} לי אישית,',
-        f'ולאחר {terms["warned"]} כי {terms["pronoun"]} לאמר את האמת אחרת יהיה',
-        f'{terms["expected"]} לעונשים הקבועים בחוק אם לא יעשה כן,',
-        f'{terms["confirmed"]} את נכונות ההצהרה ) {terms["signed"]} עליה בפני (',
-        '**************************************',
-        'מירי רז יוקל מ.ר 23145'
+        OFFICE_LINE,
+        f'{title} {declarator_name} ת.ז {id_number} {known} לי אישית,',
+        f'ולאחר {warned} כי {pronoun} לאמר את האמת אחרת יהיה',
+        f'{expected} לעונשים הקבועים בחוק אם לא יעשה כן,',
+        f'{confirmed} את נכונות ההצהרה ) {signed} עליה בפני (',
+        SEPARATOR_LINE,
+        LAWYER_STAMP_LINE
     ]
     return declaration_text_lines
 
 
-def process_hebrew_text(line, current_date):
+def process_hebrew_text(line, current_date, current_date_reversed):
     """
-    Reverses the given Hebrew line for PDF usage
-    and replaces reversed date placeholders with the normal date.
+    Reverses the given Hebrew line for PDF usage while keeping the date
+    in its normal reading order.
 
     Args:
         line (str): The line of Hebrew text to process.
-        current_date (str): The current date string used to revert reversed placeholders.
+        current_date (str): The current date string as it appears in the line.
+        current_date_reversed (str): current_date[::-1], precomputed by the caller.
 
     Returns:
         str: The processed line, reversed and date-corrected.
     """
 
-    reversed_line = line[::-1]
-    reversed_line = reversed_line.replace(current_date[::-1], current_date)
-    return reversed_line
+    # Pre-reversing the date makes the final reversal restore it.
+    return line.replace(current_date, current_date_reversed)[::-1]
 
 
 def create_declaration_pdf(signature_text_lines, current_date):
@@ -110,10 +126,13 @@ def create_declaration_pdf(signature_text_lines, current_date):
     page_width = letter[0]
     y_position = 300
     line_height = 14
+    current_date_reversed = current_date[::-1]
 
     for line in signature_text_lines:
-        processed_line = process_hebrew_text(line, current_date)
-        text_width = c.stringWidth(processed_line, 'Arial', 12)
+        processed_line = _STATIC_LINES_REVERSED.get(line)
+        if processed_line is None:
+            processed_line = process_hebrew_text(line, current_date, current_date_reversed)
+        text_width = _width(processed_line)
         x_position = (page_width - text_width) / 2 - 100
         c.drawString(x_position, y_position, processed_line)
         y_position -= line_height
@@ -123,91 +142,68 @@ def create_declaration_pdf(signature_text_lines, current_date):
     return packet
 
 
-def merge_pdfs(input_pdf_path, declaration_pdf_stream):
+def _pixel_rect(x, y, size):
     """
-    Overlays the newly generated PDF declaration page onto the first page of an existing PDF.
-
-    Args:
-        input_pdf_path (str): The path to the original PDF.
-        declaration_pdf_stream (BytesIO): The in-memory PDF page to merge.
-
-    Returns:
-        str: The path to an intermediate PDF file named 'signed_declaration.pdf'.
+    Converts a square placement given in 200 DPI pixel offsets to a PDF point rectangle.
     """
+    return pymupdf.Rect(x, y, x + size, y + size) * PIXELS_TO_POINTS
 
-    reader = PdfReader(input_pdf_path)
-    declaration_pdf = PdfReader(declaration_pdf_stream)
-    first_page = reader.pages[0]
-    merge_page = PageMerge().add(declaration_pdf.pages[0])[0]
-    PageMerge(first_page).add(merge_page).render()
-
-    output_file = 'signed_declaration.pdf'
-    writer = PdfWriter()
-    writer.addPage(first_page)
-    writer.write(output_file)
-
-    return output_file
 
-
-def add_signatures(input_pdf_path, output_pdf_path, declaration_type, signature_paths):
+@functools.lru_cache(maxsize=4)
+def _signature_image(path):
     """
-    Pastes signature images onto the first page of the PDF at positions
-    dependent on the declaration_type (company, foreigner, israeli).
-
-    Args:
-        input_pdf_path (str): Path to the PDF to be signed.
-        output_pdf_path (str): Output path for the newly stamped PDF.
-        declaration_type (str): One of ['foreigner', 'company', 'israeli'].
-        signature_paths (dict): Mapping of keys {'signature', 'domicar_signature'} to image file paths.
-
-    Raises:
-        FileNotFoundError: If the signature images are missing.
+    Returns the raw bytes of a signature image, read from disk once per path.
     """
+    with open(path, 'rb') as f:
+        return f.read()
 
-    pages = convert_from_path(input_pdf_path, poppler_path=poppler_bin())
-
-    signature = Image.open(signature_paths['signature']).resize((600, 600))
-    domicar_signature = Image.open(signature_paths['domicar_signature']).resize((650, 650))
 
-    pages[0].paste(signature, (350, 1320), signature)
-    if declaration_type == 'foreigner':
-        pages[0].paste(domicar_signature, (-30, 1820), domicar_signature)
-    elif declaration_type == 'company':
-        pages[0].paste(domicar_signature, (-30, 900), domicar_signature)
-    elif declaration_type == 'israeli':
-        pages[0].paste(domicar_signature, (-30, 1650), domicar_signature)
-
-    pages[0].save(output_pdf_path, save_all=True, append_images=pages[1:])
-
-
-def adjust_pdf_size(output_pdf_path):
+def build_signed_pdf(input_pdf_path, declaration_pdf_stream, signature_paths, declaration_type, output_pdf_path):
     """
-    Ensures the final PDF is scaled to A4 dimensions (595.28 x 841.89 points).
+    Builds a single A4-wide page from the first page of an existing PDF, with the
+    declaration page overlaid and signature images inserted at positions dependent
+    on the declaration_type. The input document itself is never modified.
 
     Args:
-        output_pdf_path (str): Path to the PDF to be scaled in-place.
+        input_pdf_path (str): The path to the original PDF.
+        declaration_pdf_stream (BytesIO): The in-memory PDF page to overlay.
+        signature_paths (dict): Mapping of keys {'signature', 'domicar_signature'} to image file paths.
+        declaration_type (str): One of ['foreigner', 'company', 'israeli'].
+        output_pdf_path (str): Output path for the final PDF.
 
     Raises:
-        OSError: If the file cannot be read or written.
+        FileNotFoundError: If the input PDF or the signature images are missing.
     """
 
-    pdf = PyPDF2.PdfReader(output_pdf_path)
-    page0 = pdf.pages[0]
+    with pymupdf.open(input_pdf_path) as doc, \
+            pymupdf.open(stream=declaration_pdf_stream.read(), filetype="pdf") as declaration_pdf, \
+            pymupdf.open() as output:
+        source_rect = doc[0].rect
 
-    current_width = float(page0.mediabox.width)
-    current_height = float(page0.mediabox.height)
+        # The output page is A4 wide, keeping the source page's aspect ratio. The source
+        # page is placed by reference and every other element is scaled to match.
+        scale = A4_WIDTH / source_rect.width
+        page = output.new_page(width=A4_WIDTH, height=source_rect.height * scale)
+        page.show_pdf_page(page.rect, doc, 0)
 
-    desired_width = 595.28
-    desired_height = 841.89
+        # The declaration page is anchored at the bottom-left corner of the source page.
+        declaration_rect = declaration_pdf[0].rect
+        page.show_pdf_page(
+            pymupdf.Rect(0, source_rect.height - declaration_rect.height, declaration_rect.width, source_rect.height)
+            * scale,
+            declaration_pdf, 0
+        )
 
-    scale_factor_width = desired_width / current_width
-    scale_factor_height = desired_height / current_height
+        page.insert_image(_pixel_rect(350, 1320, 600) * scale, stream=_signature_image(signature_paths['signature']))
+        domicar_signature = _signature_image(signature_paths['domicar_signature'])
+        if declaration_type == 'foreigner':
+            page.insert_image(_pixel_rect(-30, 1820, 650) * scale, stream=domicar_signature)
+        elif declaration_type == 'company':
+            page.insert_image(_pixel_rect(-30, 900, 650) * scale, stream=domicar_signature)
+        elif declaration_type == 'israeli':
+            page.insert_image(_pixel_rect(-30, 1650, 650) * scale, stream=domicar_signature)
 
-    page0.scale_by(scale_factor_width)
-    writer = PyPDF2.PdfWriter()
-    writer.add_page(page0)
-    with open(output_pdf_path, "wb") as f:
-        writer.write(f)
+        output.save(output_pdf_path, garbage=4, deflate=True)
 
 
 def sign_declaration(name, id_number, input_pdf_path, output_folder, declaration_type, declarator_gender):
@@ -215,11 +211,11 @@ def sign_declaration(name, id_number, input_pdf_path, output_folder, declaration
     High-level function to produce a fully signed PDF from an existing PDF.
 
     Steps:
-    1. Registers Hebrew font.
+    1. Registers Hebrew font (once per process).
     2. Builds lines of text for the declaration.
-    3. Merges them onto the first PDF page.
-    4. Pastes signatures (regular + domicar) at designated positions.
-    5. Adjusts final PDF size to A4 and saves to output_folder.
+    3. Overlays them onto the first PDF page.
+    4. Inserts signatures (regular + domicar) at designated positions.
+    5. Scales the page to A4 width and saves to output_folder.
 
     Args:
         name (str): The declarant's name.
@@ -243,14 +239,11 @@ def sign_declaration(name, id_number, input_pdf_path, output_folder, declaration
     signature_text_lines = generate_declaration_text(current_date, name, id_number_reversed, declarator_gender)
     declaration_pdf_stream = create_declaration_pdf(signature_text_lines, current_date)
 
-    merged_pdf_path = merge_pdfs(input_pdf_path, declaration_pdf_stream)
-
     output_pdf_path = os.path.join(output_folder, "final_output_with_signature.pdf")
 
     if os.path.isfile(output_pdf_path):
         os.remove(output_pdf_path)
 
-    add_signatures(merged_pdf_path, output_pdf_path, declaration_type, SIGNATURE_PATHS)
-    adjust_pdf_size(output_pdf_path)
+    build_signed_pdf(input_pdf_path, declaration_pdf_stream, SIGNATURE_PATHS, declaration_type, output_pdf_path)
 
     return output_pdf_path
@@ -5,11 +5,21 @@ Contains auxiliary functions for digitalSignatureDeclaration, such as
 PDF text extraction or type detection.
 """
 
-import PyPDF2
+import functools
+import os
+
+import pymupdf
+
+COMPANY_KW = 'פרטי החברה השוכרת'
+FOREIGNER_KW = 'זר'
+# The keywords appear in the form's header, so only the leading pages are scanned.
+MAX_SCANNED_PAGES = 2
+
 
 def detect_declaration_type(file_path):
     """
-    Scans a PDF for keywords to classify the declaration as 'company', 'foreigner', or 'israeli'.
+    Scans the first pages of a PDF for keywords to classify the declaration as
+    'company', 'foreigner', or 'israeli'. Results are cached per file path and modification time.
 
     Args:
         file_path (str): Path to the PDF file.
@@ -18,12 +28,16 @@ def detect_declaration_type(file_path):
         str: One of ['company', 'foreigner', 'israeli'] based on textual content.
     """
 
-    with open(file_path, 'rb') as file:
-        reader = PyPDF2.PdfReader(file)
-        for page_num in range(len(reader.pages)):
-            text = reader.pages[page_num].extract_text()
-            if 'פרטי החברה השוכרת' in text:
+    return _detect_declaration_type(file_path, os.path.getmtime(file_path))
+
+
+@functools.lru_cache(maxsize=32)
+def _detect_declaration_type(file_path, mtime):
+    with pymupdf.open(file_path) as doc:
+        for page_num in range(min(MAX_SCANNED_PAGES, doc.page_count)):
+            text = doc[page_num].get_text()
+            if COMPANY_KW in text:
                 return 'company'
-            if 'זר' in text:
+            if FOREIGNER_KW in text:
                 return 'foreigner'
     return 'israeli'
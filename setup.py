@@ -5,10 +5,7 @@ setup(
     version="0.1",  # Version
     packages=find_packages(),  # Automatically detects all Python packages inside the project
     install_requires=[
-        "pypdf2",
-        "pillow",
-        "pdf2image",
-        "pdfrw",
+        "pymupdf~=1.25.3",
         "reportlab",
     ],
 )